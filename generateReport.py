@@ -1,7 +1,52 @@
 import re
+import string
 import markdown
 from pathlib import Path
 
+# Trailing "Support Pollinations.AI" block appended to free-tier responses
+_AD_RE = re.compile(
+    r"^---\n\n\*\*Support Pollinations\.AI:\*\*\n.*?pollinations\.ai.*",
+    re.MULTILINE | re.DOTALL,
+)
+
+# Reusable converter; reset() between documents instead of rebuilding the extension stack
+_MD = markdown.Markdown(extensions=['fenced_code', 'tables'])
+
+# Report page template, parsed once at import and filled per report
+_HTML_TPL = string.Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Markdown Report</title>
+    <style>
+        body {
+            font-family: Arial, sans-serif;
+            margin: 40px;
+        }
+        img {
+            width: ${image_width}px;
+            height: auto;
+            display: block;
+            margin-bottom: 20px;
+            border: 1px solid #ccc;
+            border-radius: 10px;
+        }
+        pre {
+            background-color: #f4f4f4;
+            padding: 20px;
+            border-radius: 8px;
+            white-space: pre-wrap;
+            word-wrap: break-word;
+        }
+    </style>
+</head>
+<body>
+    <img src="${image_path}" alt="Generated Image">
+    <pre>${md_html}</pre>
+</body>
+</html>
+""")
+
 def generate_html_report(
     image_path: str,
     markdown_text: str,
@@ -20,50 +65,19 @@ def generate_html_report(
     """
 
     def remove_pollinations_ad(md_text: str) -> str:
-        pattern = r"(?m)^---\n\n\*\*Support Pollinations\.AI:\*\*\n.*?pollinations\.ai.*"
-        return re.sub(pattern, '', md_text, flags=re.DOTALL).strip()
+        return _AD_RE.sub('', md_text).strip()
 
     # Clean markdown from ad content
     cleaned_md = remove_pollinations_ad(markdown_text)
 
     # Convert Markdown to HTML
-    md_html = markdown.markdown(cleaned_md, extensions=['fenced_code', 'tables'])
+    md_html = _MD.reset().convert(cleaned_md)
 
-    # HTML content structure
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <title>Markdown Report</title>
-        <style>
-            body {{
-                font-family: Arial, sans-serif;
-                margin: 40px;
-            }}
-            img {{
-                width: {image_width}px;
-                height: auto;
-                display: block;
-                margin-bottom: 20px;
-                border: 1px solid #ccc;
-                border-radius: 10px;
-            }}
-            pre {{
-                background-color: #f4f4f4;
-                padding: 20px;
-                border-radius: 8px;
-                white-space: pre-wrap;
-                word-wrap: break-word;
-            }}
-        </style>
-    </head>
-    <body>
-        <img src="{image_path}" alt="Generated Image">
-        <pre>{md_html}</pre>
-    </body>
-    </html>
-    """
+    html_content = _HTML_TPL.substitute(
+        image_width=image_width,
+        image_path=image_path,
+        md_html=md_html,
+    )
 
     # Save to file
     Path(output_html_file).write_text(html_content, encoding="utf-8")
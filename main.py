@@ -1,15 +1,18 @@
 import re
 import sys
-import time
 from typing import List, Dict, Optional
 from selenium import webdriver
-from selenium.webdriver.firefox.options import Options
-from selenium.webdriver.firefox.service import Service
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.common.exceptions import NoSuchElementException
-import json
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from pathlib import Path
+import orjson
 import requests
+from bs4 import BeautifulSoup, Tag
 from visualizer import visualize
 from pollinations import analyze_local_image
 from generateReport import generate_html_report
@@ -31,33 +34,36 @@ except:
 # HEADLESS MODE
 HEADLESS = True
 
+# Resources the scraper never needs; blocked over CDP to cut page load time.
+# Stylesheets stay enabled because the scroll pane is found by its computed overflow.
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*fonts.gstatic.com*", "*googleusercontent.com*", "*/maps/vt*",
+]
+
+# WAIT TIMEOUTS (seconds)
+# Upper bound for page elements to appear after navigation or a click
+WAIT_TIMEOUT = 10
+# How long a scroll may take to load more review cards before we stop scrolling
+SCROLL_WAIT_TIMEOUT = 3
+
+# Matches the first run of digits in the reviews count label
+_DIGITS_RE = re.compile(r"\d+")
+
 # SELECTORS
-PLACE_TITLE_XPATH = (
-    "/html/body/div[1]/div[3]/div[8]/div[9]/div/div/div[1]/div[2]/div/div[1]/div/"
-    "div/div[2]/div/div[1]/div[1]/h1"
-)
-
-REVIEWS_COUNT_XPATH = (
-    "/html/body/div[1]/div[3]/div[8]/div[9]/div/div/div[1]/div[2]/div/div[1]/div/div/div[2]/"
-    "div/div[1]/div[2]/div/div[1]/div[2]/span[2]/span/span/span"
-)
-REVIEWS_COUNT_XPATH2 = (
-    "/html/body/div[1]/div[3]/div[8]/div[9]/div/div/div[1]/div[2]/div/div[1]/div/div/div[2]/div/div[1]/div[2]/div/div[1]/div[2]/span[2]/span/span"
-)
-
-REVIEW_TAB_BUTTON_XPATH_2 = (  # For two tabs
-    "/html/body/div[1]/div[3]/div[8]/div[9]/div/div/div[1]/div[2]/div/div[1]/div/div/div[3]/"
-    "div/div/button[2]/div[2]/div[2]"
-)
-
-REVIEW_TAB_BUTTON_XPATH_3 = (
-    "/html/body/div[1]/div[3]/div[8]/div[9]/div/div/div[1]/div[2]/div/div[1]/div/div/div[3]/"
-    "div/div/button[3]/div[2]/div[2]"
-)
+# CSS selector for the place name heading
+PLACE_TITLE_SELECTOR = "h1.DUwDvf"
+
+# CSS selector for the "(1,234)" reviews count next to the average rating
+REVIEWS_COUNT_SELECTOR = "div.F7nice span[aria-label*='review']"
 
 # CSS class for the container holding the main tabs (Overview, Reviews, About, etc.)
 CONTAINER_CLASS_RWPXGD = "RWPxGd"
 
+# CSS selector for the "Reviews" tab inside that container
+REVIEW_TAB_BUTTON_SELECTOR = f"div.{CONTAINER_CLASS_RWPXGD} button[role='tab'][aria-label^='Reviews']"
+
 # CSS class for the "Show more" button that expands truncated review text
 SHOW_MORE_BUTTON_CLASS = "w8nwRe"
 
@@ -98,212 +104,261 @@ SERVICES_PARENT_CLASS = "PBK6be"
 # CSS class for each span inside the services wrapper that contains a service entry
 SERVICES_ENTRY_CLASS = "RfDO5c"
 
+# — Browser-side scripts — #
+
+# Async script: keeps scrolling the reviews pane while new cards keep arriving, then
+# clicks every "Show more" button, waits for the buttons to disappear (or the idle
+# timeout) and the next frame to paint, and calls back with the number of loaded cards.
+# Arguments: card class, "Show more" class, max scroll batches, idle timeout (ms).
+# Setting window.__stopLoad = true makes the pending polling loops exit without calling back.
+LOAD_REVIEWS_JS = """
+const [cardClass, moreClass, maxBatches, idleMs, done] = arguments;
+const pane = Array.from(document.querySelectorAll('div')).find(div => {
+    const s = window.getComputedStyle(div).overflowY;
+    return (s === 'auto' || s === 'scroll') && div.scrollHeight > div.clientHeight;
+});
+const count = () => document.querySelectorAll('.' + cardClass).length;
+window.__stopLoad = false;
+const finish = () => {
+    document.querySelectorAll('.' + moreClass).forEach(b => b.click());
+    const started = Date.now();
+    const settle = () => {
+        if (window.__stopLoad) return;
+        if (!document.querySelector('.' + moreClass) || Date.now() - started > idleMs) {
+            requestAnimationFrame(() => done(count()));
+        } else {
+            setTimeout(settle, 100);
+        }
+    };
+    settle();
+};
+if (!pane) {
+    finish();
+    return;
+}
+
+let batch = 0;
+const step = () => {
+    const before = count();
+    const started = Date.now();
+    pane.scrollTop = pane.scrollHeight;
+    const poll = () => {
+        if (window.__stopLoad) return;
+        if (count() > before) {
+            if (++batch >= maxBatches) finish(); else step();
+        } else if (Date.now() - started > idleMs) {
+            finish();
+        } else {
+            setTimeout(poll, 100);
+        }
+    };
+    poll();
+};
+step();
+"""
+
 
 # ==================
 # == MAIN DRIVER ==
 # ==================
 
 def initialize_driver(headless: bool = True) -> WebDriver:
-    """Initialize a headless Firefox WebDriver."""
+    """Initialize a headless Chrome WebDriver (commands go over CDP-backed chromedriver)."""
     options = Options()
-    options.headless = headless
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--window-size=1920,1080")
+    options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
     service = Service()
-    driver = webdriver.Firefox(service=service, options=options)
+    driver = webdriver.Chrome(service=service, options=options)
+
+    # Skip map tiles, photos and web fonts; only the DOM text is scraped
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
     return driver
 
 
-def initialize_english_firefox():
+def initialize_english_chrome():
     options = Options()
-    options.set_preference("intl.accept_languages",
-                           "en-US")  # Change "fr" to your desired language code (e.g., "en-US", "ar", etc.)
+    options.add_argument("--lang=en-US")  # Change "en-US" to your desired language code (e.g., "fr", "ar", etc.)
+    options.add_experimental_option("prefs", {"intl.accept_languages": "en-US"})
 
     # Initialize the WebDriver
-    driver = webdriver.Firefox(options=options)
+    driver = webdriver.Chrome(options=options)
 
     return driver
 
 
+def wait_for(driver: WebDriver, by: str, selector: str, timeout: float = WAIT_TIMEOUT) -> bool:
+    """Block until an element matching the locator is present; False on timeout."""
+    try:
+        WebDriverWait(driver, timeout).until(EC.presence_of_element_located((by, selector)))
+        return True
+    except TimeoutException:
+        return False
+
+
 def navigate_to_url(driver: WebDriver, url: str) -> None:
     """Navigate to the given URL and wait for initial load."""
     driver.get(url)
-    time.sleep(3)  # Allow time for initial page load
+    if not wait_for(driver, By.CSS_SELECTOR, PLACE_TITLE_SELECTOR):
+        print("Place title did not appear within", WAIT_TIMEOUT, "seconds.")
 
 
 def get_place_title(driver: WebDriver) -> str:
     """Extract the place title from the page."""
-    try:
-        title_element = driver.find_element(By.XPATH, PLACE_TITLE_XPATH)
-        title = title_element.text.strip()
-        return title if title else "Unknown Place"
-    except Exception as e:
-        print("Failed to extract place title:", e)
+    title_elements = driver.find_elements(By.CSS_SELECTOR, PLACE_TITLE_SELECTOR)
+    if not title_elements:
+        print("Failed to extract place title: no element matches", PLACE_TITLE_SELECTOR)
         return "Unknown Place"
+    title = title_elements[0].text.strip()
+    return title if title else "Unknown Place"
 
 
 def get_total_reviews(driver: WebDriver) -> Optional[int]:
     """Click the reviews button and extract the total number of reviews."""
-    try:
-        try:
-            element = driver.find_element(By.XPATH, REVIEWS_COUNT_XPATH)
-            element.click()
-            time.sleep(2)
-            text = element.text
-            number = int(re.search(r"\d+", text).group())
-            print(f"Found {number} reviews.")
-            return number
-        except:
-            element = driver.find_element(By.XPATH, REVIEWS_COUNT_XPATH2)
-            element.click()
-            time.sleep(2)
-            text = element.text
-            number = int(re.search(r"\d+", text).group())
-            print(f"Found {number} reviews.")
-            return number
-    except (NoSuchElementException, AttributeError, ValueError) as e:
-        print("Failed to extract number of reviews:", e)
+    elements = driver.find_elements(By.CSS_SELECTOR, REVIEWS_COUNT_SELECTOR)
+    if not elements:
+        print("Failed to extract number of reviews: no element matches", REVIEWS_COUNT_SELECTOR)
+        return None
+
+    element = elements[0]
+    match = _DIGITS_RE.search(element.text.replace(",", ""))
+    if not match:
+        print("Failed to extract number of reviews: no digits in", repr(element.text))
         return None
 
+    element.click()
+    # The click opens the reviews list; wait for its first cards to render
+    wait_for(driver, By.CLASS_NAME, REVIEW_CONTAINER_CLASS)
+    number = int(match.group())
+    print(f"Found {number} reviews.")
+    return number
+
 
 def click_review_tab(driver: WebDriver) -> None:
     """Click the 'Reviews' tab inside the reviews section."""
     try:
-        container = driver.find_element(By.CLASS_NAME, CONTAINER_CLASS_RWPXGD)
-        buttons = container.find_elements(By.TAG_NAME, "button")
-        if len(buttons) == 3:
-
-            review_button = driver.find_element(By.XPATH, REVIEW_TAB_BUTTON_XPATH_2)
-        else:
-            review_button = driver.find_element(By.XPATH, REVIEW_TAB_BUTTON_XPATH_3)
+        review_button = WebDriverWait(driver, WAIT_TIMEOUT).until(
+            EC.element_to_be_clickable((By.CSS_SELECTOR, REVIEW_TAB_BUTTON_SELECTOR))
+        )
         review_button.click()
-        time.sleep(2)
+        wait_for(driver, By.CLASS_NAME, REVIEW_CONTAINER_CLASS)
     except Exception as e:
         print("Review tab not found or already open:", e)
 
 
-def scroll_to_load_reviews(driver: WebDriver, total_reviews: int) -> None:
-    """Scroll the reviews section to load all content."""
+def load_all_reviews(driver: WebDriver, total_reviews: int) -> int:
+    """
+    Scroll the reviews section until no new cards load, then expand all 'Show more'
+    sections. Runs entirely in the browser, so it costs a single WebDriver call.
+    """
     batches = max((total_reviews // 10) + 2, 5)
-    last_height = 0
-
-    for i in range(batches):
-        driver.execute_script(
-            """
-            const pane = Array.from(document.querySelectorAll('div')).find(div => {
-                const s = window.getComputedStyle(div).overflowY;
-                return (s === 'auto' || s === 'scroll') && div.scrollHeight > div.clientHeight;
-            });
-            if (pane) {
-                pane.scrollTop = pane.scrollHeight;
-            }
-            """
+    driver.set_script_timeout(batches * SCROLL_WAIT_TIMEOUT + WAIT_TIMEOUT)
+    try:
+        loaded = driver.execute_async_script(
+            LOAD_REVIEWS_JS,
+            REVIEW_CONTAINER_CLASS,
+            SHOW_MORE_BUTTON_CLASS,
+            batches,
+            SCROLL_WAIT_TIMEOUT * 1000,
         )
-        time.sleep(2)
-
-        new_height = driver.execute_script(
-            """
-            const pane = Array.from(document.querySelectorAll('div')).find(div => {
-                const s = window.getComputedStyle(div).overflowY;
-                return (s === 'auto' || s === 'scroll') && div.scrollHeight > div.clientHeight;
-            });
-            return pane ? pane.scrollHeight : 0;
-            """
+    except TimeoutException as e:
+        print("Loading reviews timed out, continuing with what is loaded:", e)
+        # Stop the still-running browser-side loop before expanding and snapshotting
+        driver.execute_script("window.__stopLoad = true;")
+        expand_show_more_buttons(driver)
+        return len(driver.find_elements(By.CLASS_NAME, REVIEW_CONTAINER_CLASS))
+
+    print(f"Finished scrolling. Loaded {loaded} review cards.")
+    return loaded
+
+
+def expand_show_more_buttons(driver: WebDriver) -> None:
+    """Expand all 'Show more' text sections and wait until the buttons are gone."""
+    driver.execute_script(
+        f"document.querySelectorAll('.{SHOW_MORE_BUTTON_CLASS}').forEach(b => b.click());"
+    )
+    try:
+        WebDriverWait(driver, SCROLL_WAIT_TIMEOUT).until(
+            lambda d: not d.find_elements(By.CLASS_NAME, SHOW_MORE_BUTTON_CLASS)
         )
+    except TimeoutException:
+        print("Some 'Show more' sections did not expand.")
+
+
+def _text_with_breaks(el: Tag) -> str:
+    """Return the element's stripped text with <br> turned into newlines, like Selenium's .text."""
+    for br in el.find_all("br"):
+        br.replace_with("\n")
+    return el.get_text().strip()
+
 
-        if new_height == last_height:
-            print(f"No more new reviews after {i + 1} scrolls.")
+def _parse_card(card: Tag) -> Optional[Dict]:
+    """Extract date, rating, text and owner response from one review card, or None to skip it."""
+    # 1) USER REVIEW TEXT (only under MyEned)
+    review_el = card.select_one(f".{REVIEW_BLOCK_CLASS} .{REVIEW_TEXT_CLASS}")
+    if review_el is None:
+        # no actual review → skip this card
+        return None
+    review_text = _text_with_breaks(review_el)
+
+    # 2) SERVICES (only if we have review_text)
+    services = []
+    svc_wrapper = card.select_one(f".{SERVICES_PARENT_CLASS}")
+    if svc_wrapper is not None:
+        # skip the first <div> (the “Services” label), process any further <div> entries
+        for entry in svc_wrapper.find_all("div", recursive=False)[1:]:
+            # each entry has a span.RfDO5c containing the actual service list
+            svc_el = entry.select_one(f".{SERVICES_ENTRY_CLASS}")
+            svc = svc_el.get_text().strip() if svc_el is not None else ""
+            if svc:
+                services.append(svc)
+
+    if services:
+        review_text += f" (Services: {'; '.join(services)})"
+
+    # 3) DATE
+    review_date = None
+    for cls in DATE_CLASSES:
+        date_el = card.select_one(f".{cls}")
+        if date_el is not None:
+            review_date = date_el.get_text().strip()
             break
-        last_height = new_height
+    if not review_date:
+        return None
 
-    print("Finished scrolling. All reviews should be loaded.")
+    # 4) RATING
+    rating_el = card.select_one(f".{RATING_TEXT_CLASS}")
+    if rating_el is not None:
+        rating = rating_el.get_text().strip()
+    else:
+        # fall back to counting filled stars only when there is no text rating
+        star_container = card.select_one(f".{STAR_CONTAINER_CLASS}")
+        if star_container is not None:
+            rating = f"{len(star_container.select(f'.{FILLED_STAR_CLASS}'))}/5"
+        else:
+            rating = "N/A"
 
+    # 5) OWNER RESPONSE
+    owner_el = card.select_one(f".{OWNER_BLOCK_CLASS} .{REVIEW_TEXT_CLASS}")
+    owner_text = _text_with_breaks(owner_el) if owner_el is not None else None
+
+    return {
+        "date": review_date,
+        "rating": rating,
+        "text": review_text,
+        "owner": owner_text
+    }
 
-def expand_show_more_buttons(driver: WebDriver) -> None:
-    """Expand all 'Show more' text sections."""
-    try:
-        buttons = driver.find_elements(By.CLASS_NAME, SHOW_MORE_BUTTON_CLASS)
-        for btn in buttons:
-            try:
-                driver.execute_script("arguments[0].click();", btn)
-                time.sleep(0.2)
-            except Exception as e:
-                print("Could not expand review:", e)
-    except Exception as e:
-        print("No 'Show more' buttons found:", e)
 
 def extract_reviews_data(driver: WebDriver) -> List[Dict]:
-    reviews = []
-    cards = driver.find_elements(By.CLASS_NAME, REVIEW_CONTAINER_CLASS)
-
-    for card in cards:
-        try:
-            # 1) USER REVIEW TEXT (only under MyEned)
-            try:
-                review_block = card.find_element(By.CLASS_NAME, REVIEW_BLOCK_CLASS)
-                review_text = review_block.find_element(By.CLASS_NAME, REVIEW_TEXT_CLASS).text.strip()
-            except:
-                # no actual review → skip this card
-                continue
-
-            # 2) SERVICES (only if we have review_text)
-            services = []
-            try:
-                svc_wrapper = card.find_element(By.CLASS_NAME, SERVICES_PARENT_CLASS)
-                # skip the first <div> (the “Services” label), process any further <div> entries
-                entries = svc_wrapper.find_elements(By.XPATH, "./div[position()>1]")
-                for entry in entries:
-                    # each entry has a span.RfDO5c containing the actual service list
-                    svc = entry.find_element(By.CLASS_NAME, SERVICES_ENTRY_CLASS).text.strip()
-                    if svc:
-                        services.append(svc)
-            except:
-                pass
-
-            if services:
-                review_text += f" (Services: {'; '.join(services)})"
-
-            # 3) DATE
-            review_date = None
-            for cls in DATE_CLASSES:
-                try:
-                    review_date = card.find_element(By.CLASS_NAME, cls).text.strip()
-                    break
-                except:
-                    continue
-            if not review_date:
-                continue
-
-            # 4) RATING
-            try:
-                rating = card.find_element(By.CLASS_NAME, RATING_TEXT_CLASS).text.strip()
-            except:
-                try:
-                    stars = card.find_element(By.CLASS_NAME, STAR_CONTAINER_CLASS) \
-                        .find_elements(By.CLASS_NAME, FILLED_STAR_CLASS)
-                    rating = f"{len(stars)}/5"
-                except:
-                    rating = "N/A"
-
-            # 5) OWNER RESPONSE
-            owner_text = None
-            try:
-                owner_block = card.find_element(By.CLASS_NAME, OWNER_BLOCK_CLASS)
-                owner_text = owner_block.find_element(By.CLASS_NAME, REVIEW_TEXT_CLASS).text.strip()
-            except:
-                pass
-
-            # collect
-            reviews.append({
-                "date": review_date,
-                "rating": rating,
-                "text": review_text,
-                "owner": owner_text
-            })
-
-        except Exception as e:
-            print("Skipped one card due to:", e)
-            continue
-
-    return reviews
+    """Parse every loaded review card from a single snapshot of the page source."""
+    soup = BeautifulSoup(driver.page_source, "lxml")
+    cards = soup.select(f".{REVIEW_CONTAINER_CLASS}")
+
+    reviews = [_parse_card(card) for card in cards]
+    return [review for review in reviews if review]
 
 
 def display_reviews(reviews_data: List[Dict]) -> None:
@@ -335,8 +390,7 @@ def main():
         total_reviews = get_total_reviews(driver)
         if total_reviews:
             click_review_tab(driver)
-            scroll_to_load_reviews(driver, total_reviews)
-            expand_show_more_buttons(driver)
+            load_all_reviews(driver, total_reviews)
             # show_original_text(driver)
             reviews_data = extract_reviews_data(driver)
             # display_reviews(reviews_data)
@@ -356,10 +410,7 @@ def save_reviews_to_file(reviews: List[Dict], title: str):
     """Save the list of reviews to a JSON file named after the place."""
     filename = f"{title.replace(' ', '_')}_reviews.json"
     imagepath=f"{title.replace(' ', '_')}_visual.png"
-    data_str = json.dumps(reviews, ensure_ascii=False, indent=2)
-
-    with open(filename, 'w', encoding='utf-8') as file:
-        file.write(data_str)
+    Path(filename).write_bytes(orjson.dumps(reviews, option=orjson.OPT_INDENT_2))
 
     print(f"Saved {len(reviews)} reviews to {filename}")
     print("Creating Visualization..")
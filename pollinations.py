@@ -1,17 +1,30 @@
 import requests
+from requests.adapters import HTTPAdapter
 import base64
+import mmap
 
 url = "https://text.pollinations.ai/openai"
 headers = {"Content-Type": "application/json"}
 
+# Shared keep-alive session so repeated calls skip the TCP/TLS handshake
+_SESSION = requests.Session()
+_SESSION.headers.update(headers)
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
 # Helper function to encode local image to base64
 def encode_image_base64(image_path):
     try:
-        with open(image_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode('utf-8')
+        # Encode straight from the memory-mapped file rather than an intermediate bytes copy
+        with open(image_path, "rb") as image_file, \
+                mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as image_map:
+            return base64.b64encode(image_map).decode('ascii')
     except FileNotFoundError:
         print(f"Error: Image file not found at {image_path}")
         return None
+    except ValueError:
+        # mmap refuses zero-length files
+        print(f"Error: Image file is empty at {image_path}")
+        return None
 
 def analyze_local_image(image_path, question="As an expert in analysing graphs,in a step by step process explain the attached graph which consist of 4 main parts and at the end of the conclusion suggest from 10 if that place is worth going to for example 5/10 or 8/10 "):
     base64_image = encode_image_base64(image_path)
@@ -43,7 +56,7 @@ def analyze_local_image(image_path, question="As an expert in analysing graphs,i
         "max_tokens": 500
     }
     try:
-        response = requests.post(url, headers=headers, json=payload)
+        response = _SESSION.post(url, json=payload)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
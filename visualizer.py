@@ -5,8 +5,8 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 from matplotlib.dates import DateFormatter
-from textblob import TextBlob
-from wordcloud import WordCloud
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+from wordcloud import WordCloud, STOPWORDS
 import dateparser
 from pathlib import Path
 
@@ -14,7 +14,7 @@ from pathlib import Path
 WC_DEFAULTS = {
     'width': 800,
     'height': 400,
-    'stopwords': 'english',
+    'stopwords': STOPWORDS,
     'min_font_size': 10,
     'max_words': 200,
     'background_color': 'black',
@@ -25,6 +25,20 @@ DATE_FORMAT = '%Y'
 DEFAULT_ROLLING_WINDOW_DAYS = 7
 DEFAULT_PALETTE = "colorblind"
 
+# Seconds per unit for Google's "<n> <unit>s ago" review dates
+_UNIT_SECONDS = {
+    'minute': 60,
+    'hour': 3600,
+    'day': 86400,
+    'week': 604800,
+    'month': 2592000,
+    'year': 31536000,
+}
+_REL_RE = re.compile(
+    r'^(?:an?|(\d+))\s+(minute|hour|day|week|month|year)s?\s+ago$',
+    re.IGNORECASE,
+)
+
 
 # --- Helper Functions ---
 
@@ -38,14 +52,29 @@ def parse_relative_date(date_str: str) -> Optional[pd.Timestamp]:
     return pd.to_datetime(dt) if dt else None
 
 
-def parse_rating(rating_str: str) -> Optional[float]:
+def parse_relative_dates(dates: pd.Series) -> pd.Series:
+    """
+    Column-wise version of parse_relative_date. Common "<n> <unit>s ago"
+    strings are resolved with vectorized arithmetic; only the remaining
+    entries go through dateparser. Unparseable dates become NaT.
+    """
+    clean = dates.fillna('').astype(str).str.strip().str.replace(r'^Edited\s+', '', regex=True)
+    parts = clean.str.extract(_REL_RE)
+    count = pd.to_numeric(parts[0], errors='coerce').fillna(1)
+    seconds = count * parts[1].str.lower().map(_UNIT_SECONDS)
+    result = pd.Timestamp.now() - pd.to_timedelta(seconds, unit='s')
+
+    misses = result.isna()
+    if misses.any():
+        result[misses] = pd.to_datetime(clean[misses].map(parse_relative_date))
+    return result
+
+
+def parse_ratings(ratings: pd.Series) -> pd.Series:
     """
-    Convert 'x/5' style rating to float x. Returns None for invalid formats.
+    Convert a column of 'x/5' style ratings to floats x. Invalid formats become NaN.
     """
-    try:
-        return float(rating_str.split('/')[0])
-    except (AttributeError, ValueError, IndexError):
-        return None
+    return pd.to_numeric(ratings.astype('string').str.split('/').str[0], errors='coerce')
 
 
 def _apply_style(bg_color: str = 'white') -> None:
@@ -104,19 +133,20 @@ def visualize(
         Matplotlib Figure object containing all visualizations
     """
     # --- Data Loading & Preparation ---
-    df = pd.read_json(filename)
-    df['date'] = df['date'].apply(parse_relative_date)
-    df['rating'] = df['rating'].apply(parse_rating)
+    # Columns are parsed explicitly below, so skip pandas' own dtype and date inference
+    df = pd.read_json(filename, orient='records', dtype=False, convert_dates=False)
+    df['date'] = parse_relative_dates(df['date'])
+    df['rating'] = parse_ratings(df['rating'])
     df.dropna(subset=['date', 'rating', 'text'], inplace=True)
 
-    df['date'] = pd.to_datetime(df['date'])
     df = df.sort_values('date').set_index('date')
     df = df[df.index <= pd.Timestamp.now()]
 
     # --- Feature Engineering ---
-    df['raw_sentiment'] = df['text'].apply(
-        lambda t: TextBlob(str(t)).sentiment.polarity
-    )
+    analyzer = SentimentIntensityAnalyzer()
+    df['raw_sentiment'] = [
+        analyzer.polarity_scores(str(t))['compound'] for t in df['text']
+    ]
     df['rating_smooth'] = df['rating'].rolling(f'{rolling_window_days}D').mean()
     df['sent_smooth'] = df['raw_sentiment'].rolling(f'{rolling_window_days}D').mean()
 